@@ -55,6 +55,9 @@ class PokemonBattle(object):
                 self._update_battlefield()
                 self._view.display_dialogue(turn_summary,
                                             on_ok=self.perform_available_actions)
+                # The view has copied the messages, so the summary can be
+                # recycled.
+                turn_summary.release()
             # Check if the action caused the game to be over.
             if self._battle.is_over():
                 self.game_over()
@@ -1,13 +1,69 @@
 from __future__ import annotations
 from typing import Dict, List, Optional, Tuple
 from pokemon_game_support import *
-from math import floor
+from bisect import bisect
+from contextlib import contextmanager
+from fractions import Fraction
+from random import random as _random
+
+
+# Experience awarded when a pokemon of a given level faints, precomputed
+# for every realistic level.
+_EXP_ON_DEATH = tuple(200 * level // 7 for level in range(256))
+
+
+def _apply_modifier_kernel(stats: 'PokemonStats', modifier: Stats) -> Stats:
+    """Numeric kernel for stat modification: element-wise add of a modifier
+    onto base stats, clamped at zero.
+
+    Parameters:
+        stats (PokemonStats): The base stats to modify.
+        modifier (Stats): The modifier to add to each stat.
+
+    Returns:
+        (Stats): The modified stat values.
+    """
+    hit_chance = stats._hit_chance + modifier[0]
+    max_health = stats._max_health + modifier[1]
+    attack = stats._attack + modifier[2]
+    defense = stats._defense + modifier[3]
+    return (hit_chance if hit_chance > 0 else 0,
+            max_health if max_health > 0 else 0,
+            attack if attack > 0 else 0,
+            defense if defense > 0 else 0)
+
+
+def _resolve_attack(base_damage: int, move_hit: float, pokemon_hit: float,
+                    attack: int, defense: int, eff_num: int, eff_den: int,
+                    roll: float) -> Tuple[bool, int]:
+    """Numeric kernel for attack resolution: hit roll plus the integer
+    damage formula, taking only scalars so it stays free of attribute
+    loads on the hot path.
+
+    Parameters:
+        base_damage (int): The attack's base damage.
+        move_hit (float): The attack's hit chance.
+        pokemon_hit (float): The attacking pokemon's hit chance.
+        attack (int): The attacking pokemon's attack stat.
+        defense (int): The defending pokemon's defense stat.
+        eff_num (int): Numerator of the type effectiveness ratio.
+        eff_den (int): Denominator of the type effectiveness ratio.
+        roll (float): A uniform random roll in [0, 1).
+
+    Returns:
+        (tuple): Whether the attack hit, and the damage dealt if it did.
+    """
+    if roll >= move_hit * pokemon_hit:
+        return False, 0
+    return True, (base_damage * eff_num * attack) // ((defense + 1) * eff_den)
 
 
 class PokemonStats(object):
     """A class modelling the stats of a pokemon. These stats must be
     non-negative. """
 
+    __slots__ = ('_hit_chance', '_max_health', '_attack', '_defense')
+
     def __init__(self, stats: Stats) -> None:
         """
         Constructs an instance of PokemonStats.
@@ -17,36 +73,41 @@ class PokemonStats(object):
                             The format of the incoming stats are:
                             (hit_chance, health, attack, defense)
         """
-        self._stats = stats
+        # stored flat, so getters avoid a tuple subscript per access
+        self._hit_chance = stats[STAT_HIT_CHANCE]
+        self._max_health = stats[STAT_MAX_HEALTH]
+        self._attack = stats[STAT_ATTACK]
+        self._defense = stats[STAT_DEFENSE]
 
     def level_up(self) -> None:
         """Grows the PokemonStats instance after the pokemon has levelled up."""
 
         # hit_chance changed to 1.0
-        new_stats = [1.0]
-
-        # increase the rest by 5%
-        for i in (STAT_MAX_HEALTH, STAT_ATTACK, STAT_DEFENSE):
-            new_stats.append(floor(self._stats[i] * LEVEL_UP_STAT_GROWTH))
+        self._hit_chance = 1.0
 
-        self._stats = tuple(new_stats)
+        # increase the rest by 5%; int() truncation matches floor() for
+        # these non-negative stats and is a C-level cast
+        growth = LEVEL_UP_STAT_GROWTH
+        self._max_health = int(self._max_health * growth)
+        self._attack = int(self._attack * growth)
+        self._defense = int(self._defense * growth)
 
     def get_hit_chance(self) -> float:
         """(float) Return the pokemon's current chance at making a successful
         attack. """
-        return self._stats[STAT_HIT_CHANCE]
+        return self._hit_chance
 
     def get_max_health(self) -> int:
         """(int) Return the pokemon's max health."""
-        return self._stats[STAT_MAX_HEALTH]
+        return self._max_health
 
     def get_attack(self) -> int:
         """"(int) Return the pokemon's attack stat"""
-        return self._stats[STAT_ATTACK]
+        return self._attack
 
     def get_defense(self) -> int:
         """(int) Return the pokemon's defense stat"""
-        return self._stats[STAT_DEFENSE]
+        return self._defense
 
     def apply_modifier(self, modifier: Stats) -> PokemonStats:
         """Applies a stat modifier and returns the newly constructed,
@@ -58,18 +119,13 @@ class PokemonStats(object):
         Returns:
             (PokemonStats): a newly constructed pokemon stats.
         """
-        modified_stats = []
-        for i, change in enumerate(modifier):
-            modified_val = self._stats[i] + change
-            if modified_val < 0:
-                modified_val = 0
-            modified_stats.append(modified_val)
-
-        return PokemonStats(tuple(modified_stats))
+        return PokemonStats(_apply_modifier_kernel(self, modifier))
 
     def __str__(self) -> str:
         """(str) Returns a string representation of this class."""
-        return f'{self.__class__.__name__}({self._stats})'
+        stats = (self._hit_chance, self._max_health, self._attack,
+                 self._defense)
+        return f'{type(self).__name__}({stats})'
 
     def __repr__(self) -> str:
         """(str) Returns a string representation of this class."""
@@ -79,6 +135,14 @@ class PokemonStats(object):
 class Pokemon(object):
     """A class which represents a Pokemon."""
 
+    __slots__ = ('_name', '_stats', '_stat_modifiers',
+                 '_combined_modifier', '_cached_stats', '_cached_dirty',
+                 '_element_type', '_type_id', '_moves', '_move_uses',
+                 '_move_index', '_move_names',
+                 '_level',
+                 '_health', '_experience', '_next_level_exp', '_owner',
+                 '_roster_index')
+
     def __init__(
             self, name: str, stats: PokemonStats, element_type: str,
             moves: List[Move], level: int = 1
@@ -95,17 +159,31 @@ class Pokemon(object):
         """
         self._name = name
         self._stats = stats
-        self._stat_modifiers = {}  # keep track of the rounds of the modifiers
+        self._stat_modifiers = []  # [rounds_remaining, modifier] entries
         self._combined_modifier = [0.0, 0, 0, 0]  # keep track of the overall effect of the modifiers
+        # cache the modified stats; recomputed only when marked dirty
+        self._cached_stats = stats
+        self._cached_dirty = False
         self._element_type = element_type
-
-        self._moves = {}
+        self._type_id = ElementType.id_of(element_type)
+
+        # moves and their remaining uses are kept in parallel lists sorted
+        # by name, with a parallel index for O(1) lookups and a parallel
+        # name list so insertion never re-fetches names
+        self._moves = []
+        self._move_uses = []
+        self._move_index = {}
+        self._move_names = []
         for move in moves:
-            self._moves[move] = move.get_max_uses()
+            self.learn_move(move)
 
         self._level = level
         self._health = stats.get_max_health()
         self._experience = self._level ** 3
+        self._next_level_exp = (level + 1) ** 3
+        # both set when added to a trainer's roster
+        self._owner = None
+        self._roster_index = -1
 
     def get_name(self) -> str:
         """(str) Get this pokemon's name."""
@@ -124,6 +202,10 @@ class Pokemon(object):
         """(str) Get the name of the type of this pokemon."""
         return self._element_type
 
+    def get_type_id(self) -> int:
+        """(int) Get the integer id of this pokemon's type."""
+        return self._type_id
+
     def get_remaining_move_uses(self, move: Move) -> int:
         """Gets the number of moves left for the supplied move, or 0 if the
         pokemon doesn't know the move.
@@ -135,7 +217,8 @@ class Pokemon(object):
             (int): the number of moves left for the supplied move, or 0 if the
             pokemon doesn't know the move.
         """
-        return self._moves.get(move, 0)
+        index = self._move_index.get(move)
+        return self._move_uses[index] if index is not None else 0
 
     def get_level(self) -> int:
         """(int) Get the level of this pokemon."""
@@ -148,16 +231,14 @@ class Pokemon(object):
     def get_next_level_experience_requirement(self) -> int:
         """(int) Return the total experience required for the pokemon to be
         one level higher. """
-        return (self._level + 1) ** 3
+        return self._next_level_exp
 
     def get_move_info(self) -> List[Tuple[Move, int]]:
         """(list) Return a list of the pokemon's known moves and their
         remaining uses. """
 
-        move_info = list(self._moves.items())
-        move_info.sort(key=lambda move_uses_tuple: move_uses_tuple[
-            0].get_name())  # sort by name
-        return move_info
+        # the move lists are kept sorted by name, so no sort is needed here
+        return list(zip(self._moves, self._move_uses))
 
     def has_fainted(self) -> bool:
         """(bool) Return true iff the pokemon has fainted."""
@@ -170,12 +251,21 @@ class Pokemon(object):
             change (int): The health change to be applied to the pokemon.
         """
         max_health = self.get_stats().get_max_health()
+        was_fainted = self._health == 0
         self._health += change
         if self._health < 0:
             self._health = 0
         elif self._health > max_health:
             self._health = max_health
 
+        # keep the owning trainer's alive mask in sync
+        if self._owner is not None:
+            if was_fainted:
+                if self._health > 0:
+                    self._owner._alive_mask |= 1 << self._roster_index
+            elif self._health == 0:
+                self._owner._alive_mask &= ~(1 << self._roster_index)
+
     def gain_experience(self, experience: int) -> None:
         """Increase the experience of this pokemon by the supplied amount, and level up if necessary.
 
@@ -183,7 +273,7 @@ class Pokemon(object):
             experience (int): The amount of experience points to increase.
         """
         self._experience += experience
-        while self._experience >= self.get_next_level_experience_requirement():
+        while self._experience >= self._next_level_exp:
             self.level_up()
 
     def level_up(self) -> None:
@@ -192,17 +282,22 @@ class Pokemon(object):
         the maximum hp increased. """
         old_max_health = self.get_max_health()
         self._stats.level_up()
+        self._cached_dirty = True
 
         # increase its current health
         max_health_increment = self.get_max_health() - old_max_health
         self.modify_health(max_health_increment)
 
         self._level += 1
+        self._next_level_exp = (self._level + 1) ** 3
 
     def experience_on_death(self) -> int:
         """(int) The experience awarded to the victorious pokemon if this
         pokemon faints. """
-        return floor(200 * self.get_level() / 7)
+        level = self._level
+        if level < len(_EXP_ON_DEATH):
+            return _EXP_ON_DEATH[level]
+        return 200 * level // 7
 
     def can_learn_move(self, move: Move) -> bool:
         """Returns true iff the pokemon can learn the given move. i.e. they
@@ -215,8 +310,8 @@ class Pokemon(object):
         Returns:
              (bool): true iff the pokemon can learn the given move.
         """
-        return not (len(
-            self._moves) == MAXIMUM_MOVE_SLOTS or move in self._moves)
+        return move not in self._move_index and \
+            len(self._moves) < MAXIMUM_MOVE_SLOTS
 
     def learn_move(self, move: Move) -> None:
         """Learns the given move, assuming the pokemon is able to.
@@ -224,7 +319,14 @@ class Pokemon(object):
         Parameters:
             move (Move): move for pokemon to learn.
         """
-        self._moves[move] = move.get_max_uses()
+        # keep the lists sorted by name so get_move_info needs no sort
+        name = move.get_name()
+        index = bisect(self._move_names, name)
+        self._move_names.insert(index, name)
+        self._moves.insert(index, move)
+        self._move_uses.insert(index, move.get_max_uses())
+        for shifted in range(index, len(self._moves)):
+            self._move_index[self._moves[shifted]] = shifted
 
     def forget_move(self, move: Move) -> None:
         """Forgets the supplied move, if the pokemon knows it.
@@ -232,7 +334,13 @@ class Pokemon(object):
         Parameters:
             move (Move): move for pokemon to forget.
         """
-        self._moves.pop(move, 0)
+        index = self._move_index.pop(move, None)
+        if index is not None:
+            del self._moves[index]
+            del self._move_uses[index]
+            del self._move_names[index]
+            for shifted in range(index, len(self._moves)):
+                self._move_index[self._moves[shifted]] = shifted
 
     def has_moves_left(self) -> bool:
         """(bool) Returns true iff the pokemon has any moves they can use"""
@@ -244,9 +352,10 @@ class Pokemon(object):
         Parameters:
             move (Move): move for pokemon to reduce.
         """
-        if self.get_remaining_move_uses(move) > 0:
-            self._moves[move] -= 1
-            if self._moves[move] == 0:
+        index = self._move_index.get(move)
+        if index is not None and self._move_uses[index] > 0:
+            self._move_uses[index] -= 1
+            if self._move_uses[index] == 0:
                 self.forget_move(move)
 
     def add_stat_modifier(self, modifier: Stats, rounds: int) -> None:
@@ -257,49 +366,71 @@ class Pokemon(object):
             rounds (int): The number of rounds that the stat modifier will be in
                         effect for.
         """
-        self._stat_modifiers[PokemonStats(modifier)] = [rounds, modifier]
-        for stat in (
-        STAT_HIT_CHANCE, STAT_MAX_HEALTH, STAT_ATTACK, STAT_DEFENSE):
-            self._combined_modifier[stat] += modifier[stat]
-
-        self.modify_health(
-            0)  # update health if it exceeds the modified max_health
+        self._stat_modifiers.append([rounds, modifier])
+        combined = self._combined_modifier
+        combined[STAT_HIT_CHANCE] += modifier[STAT_HIT_CHANCE]
+        combined[STAT_MAX_HEALTH] += modifier[STAT_MAX_HEALTH]
+        combined[STAT_ATTACK] += modifier[STAT_ATTACK]
+        combined[STAT_DEFENSE] += modifier[STAT_DEFENSE]
+        self._cached_dirty = True
+
+        if modifier[STAT_MAX_HEALTH]:
+            # update health if it exceeds the modified max_health
+            self.modify_health(0)
 
     def get_stats(self) -> PokemonStats:
         """(PokemonStats) Return the pokemon stats after applying all current
         modifications. """
-        return self._stats.apply_modifier(tuple(self._combined_modifier))
+        if self._cached_dirty:
+            self._cached_stats = self._stats.apply_modifier(
+                tuple(self._combined_modifier))
+            self._cached_dirty = False
+        return self._cached_stats
 
     def post_round_actions(self) -> None:
         """Update the stat modifiers by decrementing their remaining turns."""
-        delete_modifiers = []
-        for stat_modifier, (_, modifier) in self._stat_modifiers.items():
-            self._stat_modifiers[stat_modifier][
-                0] -= 1  # decrease the round by 1, then remove it if it ends
-            if self._stat_modifiers[stat_modifier][0] == 0:
-                for stat in (
-                STAT_HIT_CHANCE, STAT_MAX_HEALTH, STAT_ATTACK, STAT_DEFENSE):
-                    self._combined_modifier[stat] -= modifier[stat]
-                delete_modifiers.append(stat_modifier)
-
-        # update health if it exceeds the modified max_health
-        self.modify_health(0)
-        # delete modifiers that are no longer working
-        for delete_modifier in delete_modifiers:
-            del self._stat_modifiers[delete_modifier]
+        modifiers = self._stat_modifiers
+        combined = self._combined_modifier
+        i = 0
+        max_health_changed = False
+        while i < len(modifiers):
+            entry = modifiers[i]
+            entry[0] -= 1  # decrease the round by 1, then remove it if it ends
+            if entry[0] == 0:
+                modifier = entry[1]
+                combined[STAT_HIT_CHANCE] -= modifier[STAT_HIT_CHANCE]
+                combined[STAT_MAX_HEALTH] -= modifier[STAT_MAX_HEALTH]
+                combined[STAT_ATTACK] -= modifier[STAT_ATTACK]
+                combined[STAT_DEFENSE] -= modifier[STAT_DEFENSE]
+                self._cached_dirty = True
+                if modifier[STAT_MAX_HEALTH]:
+                    max_health_changed = True
+                # swap-pop: O(1) removal, order doesn't matter
+                modifiers[i] = modifiers[-1]
+                modifiers.pop()
+            else:
+                i += 1
+
+        if max_health_changed:
+            # update health if it exceeds the modified max_health
+            self.modify_health(0)
 
     def rest(self) -> None:
         """Returns this pokemon to max health, removes any remaining stat
         modifiers, and resets all move uses to their maximums. """
+        if self._health == 0 and self._owner is not None:
+            self._owner._alive_mask |= 1 << self._roster_index
         self._health = self.get_max_health()
 
         # removes any remaining stat modifiers
         self._stat_modifiers.clear()
         self._combined_modifier = [0.0, 0, 0, 0]
+        self._cached_dirty = True
 
         # resets all move uses
-        for move in self._moves.keys():
-            self._moves[move] = move.get_max_uses()
+        uses = self._move_uses
+        for index, move in enumerate(self._moves):
+            uses[index] = move.get_max_uses()
 
     def __str__(self) -> str:
         """(str) Returns a simple representation of this pokemon's name and
@@ -314,6 +445,10 @@ class Pokemon(object):
 class Trainer(object):
     """A class representing a pokemon trainer."""
 
+    __slots__ = ('_name', '_inventory', '_roster', '_roster_set',
+                 '_current_pokemon_index', '_alive_mask',
+                 '_cached_first_pokeball')
+
     def __init__(self, name: str) -> None:
         """Create an instance of the Trainer class.
 
@@ -323,7 +458,10 @@ class Trainer(object):
         self._name = name
         self._inventory = {}
         self._roster = []
+        self._roster_set = set()  # mirrors _roster for O(1) membership
         self._current_pokemon_index = 0
+        self._alive_mask = 0  # bit i set iff roster[i] hasn't fainted
+        self._cached_first_pokeball = None  # refreshed on inventory changes
 
     def get_name(self) -> str:
         """(str) Return the trainer's name."""
@@ -343,7 +481,7 @@ class Trainer(object):
 
     def get_all_pokemon(self) -> List[Pokemon]:
         """(list) Returns the trainer's pokemon."""
-        return list(tuple(self._roster))
+        return self._roster.copy()
 
     def rest_all_pokemon(self) -> None:
         """Rests all pokemon in the party"""
@@ -361,15 +499,12 @@ class Trainer(object):
             (bool): True iff the supplied pokemon can be added to this trainer's
                 roster.
         """
-        return not (len(
-            self._roster) == MAXIMUM_POKEMON_ROSTER or pokemon in self._roster)
+        return pokemon not in self._roster_set and \
+            len(self._roster) < MAXIMUM_POKEMON_ROSTER
 
     def all_pokemon_fainted(self) -> bool:
         """(bool) Return true iff all the trainer's pokemon have fainted."""
-        for pokemon in self._roster:
-            if not pokemon.has_fainted():
-                return False
-        return True
+        return self._alive_mask == 0
 
     def add_pokemon(self, pokemon: Pokemon) -> None:
         """Adds a new pokemon into the roster, assuming that doing so would
@@ -378,7 +513,12 @@ class Trainer(object):
         Parameters:
             pokemon (Pokemon): The pokemon to add.
         """
+        pokemon._roster_index = len(self._roster)
         self._roster.append(pokemon)
+        self._roster_set.add(pokemon)
+        pokemon._owner = self
+        if pokemon._health > 0:
+            self._alive_mask |= 1 << pokemon._roster_index
 
     def can_switch_pokemon(self, index: int) -> bool:
         """Determines if the pokemon index would be valid to switch to.
@@ -418,6 +558,8 @@ class Trainer(object):
             uses (int): The quantity of the item to be added to the inventory.
         """
         self._inventory[item] = self._inventory.get(item, 0) + uses
+        if isinstance(item, Pokeball):
+            self._refresh_first_pokeball()
 
     def has_item(self, item: Item) -> bool:
         """(bool) Returns true if the item is in the trainer's inventory and has
@@ -429,7 +571,7 @@ class Trainer(object):
         Returns:
             (bool): True if the item is in the trainer's inventory and has uses.
         """
-        return item in self._inventory and self._inventory.get(item, 0) > 0
+        return self._inventory.get(item, 0) > 0
 
     def use_item(self, item: Item) -> None:
         """If the item is present in the trainer's inventory, decrement its
@@ -439,14 +581,32 @@ class Trainer(object):
         Parameters:
             item (Item): The item to use.
         """
-        if self.has_item(item):
-            self._inventory[item] -= 1
-            if self._inventory[item] == 0:
-                del self._inventory[item]
+        count = self._inventory.get(item, 0)
+        if count <= 0:
+            return
+        if count == 1:
+            del self._inventory[item]
+            if isinstance(item, Pokeball):
+                self._refresh_first_pokeball()
+        else:
+            self._inventory[item] = count - 1
+
+    def get_first_pokeball(self) -> Optional[Item]:
+        """(Optional[Item]) Returns the first pokeball in the trainer's
+        inventory, or None if there isn't one. """
+        return self._cached_first_pokeball
+
+    def _refresh_first_pokeball(self) -> None:
+        """Recomputes the cached first pokeball after an inventory change."""
+        for item in self._inventory:
+            if isinstance(item, Pokeball):
+                self._cached_first_pokeball = item
+                return
+        self._cached_first_pokeball = None
 
     def __str__(self) -> str:
         """(str) Returns a string representation of a Trainer"""
-        return f"{self.__class__.__name__}(\'{self._name}\')"
+        return f"{type(self).__name__}(\'{self._name}\')"
 
     def __repr__(self) -> str:
         """(str) Returns a string representation of a Trainer"""
@@ -456,6 +616,10 @@ class Trainer(object):
 class Battle(object):
     """A class which represents a pokemon battle. """
 
+    __slots__ = ('_player', '_enemy', '_is_trainer_battle', '_turn',
+                 '_player_action', '_enemy_action', '_player_queued_first',
+                 '_over')
+
     def __init__(self, player: Trainer, enemy: Trainer,
                  is_trainer_battle: bool) -> None:
         """Creates an instance of a trainer battle.
@@ -469,7 +633,11 @@ class Battle(object):
         self._enemy = enemy
         self._is_trainer_battle = is_trainer_battle
         self._turn = None
-        self._action_queue = []
+        # One action slot per trainer; None means nothing is queued. The
+        # flag preserves arrival order, which breaks priority ties.
+        self._player_action = None
+        self._enemy_action = None
+        self._player_queued_first = True
         self._over = False
 
     def get_turn(self) -> Optional[bool]:
@@ -503,11 +671,12 @@ class Battle(object):
 
     def is_action_queue_full(self) -> bool:
         """(bool) Returns true if both trainers have an action queued."""
-        return len(self._action_queue) == 2
+        return self._player_action is not None and \
+            self._enemy_action is not None
 
     def is_action_queue_empty(self) -> bool:
         """(bool) Returns true if neither trainer have an action queued."""
-        return len(self._action_queue) == 0
+        return self._player_action is None and self._enemy_action is None
 
     def trainer_has_action_queued(self, is_player: bool) -> bool:
         """Returns true iff the supplied trainer has an action queued
@@ -518,10 +687,8 @@ class Battle(object):
         Returns:
             (bool): True iff the supplied trainer has an action queued
         """
-        for _, trainer in self._action_queue:
-            if trainer == is_player:
-                return True
-        return False
+        action = self._player_action if is_player else self._enemy_action
+        return action is not None
 
     def is_ready(self) -> bool:
         """(bool) Returns true iff the next action is ready to be performed.
@@ -564,7 +731,14 @@ class Battle(object):
         if not action.is_valid(self, is_player):
             return None
 
-        self._action_queue.append((action, is_player))
+        if is_player:
+            if self._enemy_action is None:
+                self._player_queued_first = True
+            self._player_action = action
+        else:
+            if self._player_action is None:
+                self._player_queued_first = False
+            self._enemy_action = action
 
     def enact_turn(self) -> Optional[ActionSummary]:
         """(Optional[ActionSummary]) Attempts to perform the next action in
@@ -573,50 +747,81 @@ class Battle(object):
         If the next action in the queue is invalid, it should still be
         removed from the queue. If this was the last turn to be performed
         that round, perform the post round actions. """
-        summary = ActionSummary()
+        summary = ActionSummary.acquire()
 
         # first turn
         if self.get_turn() is None:
-            # evaluate the priority of actions
-            if self._action_queue[0][0].get_priority() <= \
-                    self._action_queue[1][0].get_priority():
-                action_to_perform, performer = self._action_queue.pop(0)
+            # evaluate the priority of actions; ties go to whichever
+            # trainer queued first
+            player_action, enemy_action = \
+                self._player_action, self._enemy_action
+            player_priority = player_action.get_priority()
+            enemy_priority = enemy_action.get_priority()
+            if player_priority < enemy_priority or (
+                    player_priority == enemy_priority and
+                    self._player_queued_first):
+                action_to_perform, performer = player_action, True
+                self._player_action = None
             else:
-                action_to_perform, performer = self._action_queue.pop(1)
+                action_to_perform, performer = enemy_action, False
+                self._enemy_action = None
 
             if action_to_perform.is_valid(self, performer):
-                summary.combine(action_to_perform.apply(self, performer))
+                applied = action_to_perform.apply(self, performer)
+                summary.combine(applied)
+                applied.release()
 
             self._turn = not performer
 
         # last turn
         else:
-            action_to_perform, performer = self._action_queue.pop()
+            if self._player_action is not None:
+                action_to_perform, performer = self._player_action, True
+                self._player_action = None
+            else:
+                action_to_perform, performer = self._enemy_action, False
+                self._enemy_action = None
             if action_to_perform.is_valid(self, performer):
-                summary.combine(action_to_perform.apply(self, performer))
+                applied = action_to_perform.apply(self, performer)
+                summary.combine(applied)
+                applied.release()
 
             # round ends
             self._turn = None
+            post_round = Pokemon.post_round_actions
             for trainer in (self._player, self._enemy):
-                for pokemon in trainer.get_all_pokemon():
-                    pokemon.post_round_actions()
+                for pokemon in trainer._roster:
+                    post_round(pokemon)
         return summary
 
     def is_over(self) -> bool:
         """(bool) Returns true iff the battle is over. A battle is over if a
         trainer has fled, or if all of the pokemon have fainted for either
         trainer. """
-        if self._over or \
-                self._player.all_pokemon_fainted() or \
+        if self._over:
+            return True
+        if self._player.all_pokemon_fainted() or \
                 self._enemy.all_pokemon_fainted():
             self._over = True
             return True
         return False
 
 
+# Recycled ActionSummary instances, to cut allocations during mass
+# battle simulation.
+_SUMMARY_POOL: List['ActionSummary'] = []
+
+
 class ActionSummary(object):
     """A class containing messages about actions and their effects."""
 
+    __slots__ = ('_message',)
+
+    # When True, messages are discarded as they are added; simulation-only
+    # runs (AI lookahead) toggle this via silent_actions to skip the
+    # string formatting work entirely.
+    SILENT = False
+
     def __init__(self, message: Optional[str] = None) -> None:
         """Constructs a new ActionSummary with an optional message.
 
@@ -625,6 +830,27 @@ class ActionSummary(object):
         """
         self._message = [] if message is None else [message]
 
+    @classmethod
+    def acquire(cls, message: Optional[str] = None) -> 'ActionSummary':
+        """Returns a summary from the free list, or a new one if the list
+        is empty.
+
+         Parameters:
+             message (Optional): An optional message to be included.
+        """
+        if _SUMMARY_POOL:
+            summary = _SUMMARY_POOL.pop()
+            if message is not None:
+                summary._message.append(message)
+            return summary
+        return cls(message)
+
+    def release(self) -> None:
+        """Clears this summary and returns it to the free list, once its
+        messages have been consumed. """
+        self._message.clear()
+        _SUMMARY_POOL.append(self)
+
     def get_messages(self) -> List[str]:
         """(list) Returns a list of the messages contained within this
         summary. """
@@ -636,7 +862,8 @@ class ActionSummary(object):
         Parameters:
             message (str): The message to add.
         """
-        self._message.append(message)
+        if not ActionSummary.SILENT:
+            self._message.append(message)
 
     def combine(self, summary: ActionSummary) -> None:
         """Combines two ActionSummaries.
@@ -647,11 +874,26 @@ class ActionSummary(object):
         self._message.extend(summary.get_messages())
 
 
+@contextmanager
+def silent_actions():
+    """Context manager which suppresses ActionSummary messages for its
+    duration. Actions still take effect; only the log output is skipped,
+    so speculative runs (AI lookahead) avoid the string formatting work.
+    """
+    ActionSummary.SILENT = True
+    try:
+        yield
+    finally:
+        ActionSummary.SILENT = False
+
+
 class Action(object):
     """An abstract class detailing anything which takes up a turn in battle.
     Applying an action can be thought of as moving the game from one state to
     the next. """
 
+    __slots__ = ()
+
     def get_priority(self) -> int:
         """(int) Returns the priority of this action, which is used to
         determine which action is performed first each round in the battle.
@@ -676,9 +918,8 @@ class Action(object):
 
         # not valid if it is not at the beginning of the round and not the
         # trainer's turn
-        if battle.get_turn() is not None and battle.get_turn() != is_player:
-            return False
-        return True
+        turn = battle.get_turn()
+        return turn is None or turn == is_player
 
     def apply(self, battle: Battle, is_player: bool) -> ActionSummary:
         """Applies the action to the game state and returns a summary of the
@@ -693,7 +934,7 @@ class Action(object):
 
     def __str__(self) -> str:
         """(str) Returns a string representation of an Action."""
-        return f'{self.__class__.__name__}()'
+        return f'{type(self).__name__}()'
 
     def __repr__(self) -> str:
         """(str) Returns a string representation of an Action."""
@@ -703,6 +944,8 @@ class Action(object):
 class Flee(Action):
     """An action where the trainer attempts to run away from the battle."""
 
+    __slots__ = ()
+
     def is_valid(self, battle: Battle, is_player: bool) -> bool:
         """Determines if an attempt to flee would be valid for a given battle
         state. Fleeing is considered a valid action if the base action
@@ -743,12 +986,14 @@ class Flee(Action):
         else:
             summary = FLEE_SUCCESS
             battle.attempt_end_early()
-        return ActionSummary(summary)
+        return ActionSummary.acquire(summary)
 
 
 class SwitchPokemon(Action):
     """An action representing the trainer's intention to switch pokemon."""
 
+    __slots__ = ('_next_pokemon_index',)
+
     def __init__(self, next_pokemon_index: int) -> None:
         """Creates an instance of the SwitchPokemon class.
 
@@ -791,7 +1036,7 @@ class SwitchPokemon(Action):
             (ActionSummary): the message to return after switching.
         """
         trainer = battle.get_trainer(is_player)
-        summary = ActionSummary()
+        summary = ActionSummary.acquire()
 
         if not trainer.get_current_pokemon().has_fainted():
             summary.add_message(
@@ -804,13 +1049,15 @@ class SwitchPokemon(Action):
 
     def __str__(self) -> str:
         """(str) Returns a string representation of a SwitchPokemon."""
-        return f'{self.__class__.__name__}({self._next_pokemon_index})'
+        return f'{type(self).__name__}({self._next_pokemon_index})'
 
 
 class Item(Action):
     """An abstract class representing an Item, which a trainer may attempt to
     use to influence the battle. """
 
+    __slots__ = ('_name',)
+
     def __init__(self, name: str) -> None:
         """Creates an Item
 
@@ -857,12 +1104,14 @@ class Item(Action):
 
     def __str__(self):
         """(str) Returns a string representation of an Item"""
-        return f"{self.__class__.__name__}(\'{self._name}\')"
+        return f"{type(self).__name__}(\'{self._name}\')"
 
 
 class Pokeball(Item):
     """An item which a trainer can use to attempt to catch wild pokemon."""
 
+    __slots__ = ('_catch_chance',)
+
     def __init__(self, name: str, catch_chance: float) -> None:
         """Creates a pokeball instance, used to catch pokemon in wild battles
 
@@ -893,7 +1142,7 @@ class Pokeball(Item):
             return ActionSummary(POKEBALL_INVALID_BATTLE_TYPE)
 
         # failure catching
-        if not did_succeed(self._catch_chance):
+        if not _random() < self._catch_chance:
             return ActionSummary(
                 POKEBALL_UNSUCCESSFUL_CATCH.format(wild_pokemon.get_name()))
 
@@ -912,6 +1161,8 @@ class Pokeball(Item):
 class Food(Item):
     """An Item which restores HP to the pokemon whose trainer uses it."""
 
+    __slots__ = ('_health_restored',)
+
     def __init__(self, name: str, health_restored: int) -> None:
         """Create a Food instance.
 
@@ -946,6 +1197,14 @@ class Food(Item):
 class Move(Action):
     """An abstract class representing all learnable pokemon moves."""
 
+    __slots__ = ('_name', '_element_type', '_element', '_type_id',
+                 '_max_uses', '_speed', '_priority')
+
+    # Overridden by subclasses that implement the matching effect hook,
+    # so apply can skip the no-op calls entirely.
+    HAS_ALLY_EFFECT = False
+    HAS_ENEMY_EFFECT = False
+
     def __init__(self, name: str, element_type: str, max_uses: int,
                  speed: int) -> None:
         """Creates an instance of the Move class.
@@ -958,8 +1217,13 @@ class Move(Action):
         """
         self._name = name
         self._element_type = element_type
+        # resolve the element and its id once; neither changes for a
+        # given move
+        self._element = ElementType.of(element_type)
+        self._type_id = self._element.get_id()
         self._max_uses = max_uses
         self._speed = speed
+        self._priority = SPEED_BASED_ACTION_PRIORITY + speed
 
     def get_name(self) -> str:
         """(str) Return the name of this move"""
@@ -975,7 +1239,7 @@ class Move(Action):
 
     def get_priority(self) -> int:
         """(int) Returns the priority of this move."""
-        return SPEED_BASED_ACTION_PRIORITY + self._speed
+        return self._priority
 
     def is_valid(self, battle: Battle, is_player: bool) -> bool:
         """Determines if the move would be valid for the given trainer and
@@ -1015,85 +1279,100 @@ class Move(Action):
         Returns:
             (ActionSummary): the message to return after applying the move.
         """
+        # resolve all participants once; effect hooks reuse them
         trainer = battle.get_trainer(is_player)
         enemy = battle.get_trainer(not is_player)
         pokemon = trainer.get_current_pokemon()
+        enemy_pokemon = enemy.get_current_pokemon()
         pokemon.reduce_move_count(self)
-        summary = ActionSummary(f'{pokemon.get_name()} used {self.get_name()}.')
-
-        # performing the move
-        summary.combine(self.apply_ally_effects(trainer))
-        summary.combine(self.apply_enemy_effects(trainer, enemy))
+        if ActionSummary.SILENT:
+            summary = ActionSummary.acquire()
+        else:
+            summary = ActionSummary.acquire(
+                f'{pokemon.get_name()} used {self.get_name()}.')
+
+        # performing the move; skip sides this move has no effect on, and
+        # let the hooks mutate the one summary rather than combining
+        # per-side intermediates
+        if self.HAS_ALLY_EFFECT:
+            self._apply_ally(trainer, pokemon, summary)
+        if self.HAS_ENEMY_EFFECT:
+            self._apply_enemy(trainer, enemy, pokemon, enemy_pokemon, summary)
         return summary
 
-    def apply_ally_effects(self, trainer: Trainer) -> ActionSummary:
+    def apply_ally_effects(self, trainer: Trainer,
+                           pokemon: Pokemon) -> ActionSummary:
         """Apply this move's effects to the ally trainer; if appropriate,
         and return the resulting ActionSummary.
 
         Parameters
             trainer (Trainer): The trainer whose pokemon is using the move.
+            pokemon (Pokemon): The trainer's current pokemon.
 
         Returns:
             (ActionSummary): The message to return after applying the move on ally.
         """
         summary = ActionSummary()
-        pokemon = trainer.get_current_pokemon()
-
-        if type(self) is Buff:
-            summary.add_message(
-                f'{pokemon.get_name()} was buffed for {self.get_rounds()} turns.')
-            pokemon.add_stat_modifier(self.get_modification(),
-                                      self.get_rounds())
+        self._apply_ally(trainer, pokemon, summary)
         return summary
 
-    def apply_enemy_effects(self, trainer: Trainer,
-                            enemy: Trainer) -> ActionSummary:
+    def apply_enemy_effects(self, trainer: Trainer, enemy: Trainer,
+                            pokemon: Pokemon,
+                            enemy_pokemon: Pokemon) -> ActionSummary:
         """Apply this move's effects to the enemy; if appropriate, and return
         the resulting ActionSummary.
 
         Parameters
             trainer (Trainer): The trainer whose pokemon is using the move.
             enemy (Trainer): The trainer whose pokemon is the target of the move.
+            pokemon (Pokemon): The trainer's current pokemon.
+            enemy_pokemon (Pokemon): The enemy's current pokemon.
 
         Returns:
             (ActionSummary): The message to return after applying the move on enemy.
         """
         summary = ActionSummary()
-        pokemon = trainer.get_current_pokemon()
-        enemy_pokemon = enemy.get_current_pokemon()
+        self._apply_enemy(trainer, enemy, pokemon, enemy_pokemon, summary)
+        return summary
 
-        if type(self) is Debuff:
-            summary.add_message(
-                f'{enemy_pokemon.get_name()} was debuffed for {self.get_rounds()} turns.')
-            enemy_pokemon.add_stat_modifier(self.get_modification(),
-                                            self.get_rounds())
+    def _apply_ally(self, trainer: Trainer, pokemon: Pokemon,
+                    summary: ActionSummary) -> None:
+        """Hook for effects on the move user's side; no-op on the base Move.
 
-        if type(self) is Attack:
-            if not self.did_hit(pokemon):
-                summary.add_message(f'{enemy_pokemon.get_name()} missed!')
-            else:
-                enemy_pokemon.modify_health(
-                    -self.calculate_damage(pokemon, enemy_pokemon))
-                if enemy_pokemon.has_fainted():
-                    summary.add_message(
-                        f'{enemy_pokemon.get_name()} has fainted.')
+        Parameters
+            trainer (Trainer): The trainer whose pokemon is using the move.
+            pokemon (Pokemon): The trainer's current pokemon.
+            summary (ActionSummary): The summary to add messages to.
+        """
 
-                    experience = enemy_pokemon.experience_on_death()
-                    pokemon.gain_experience(experience)
-                    summary.add_message(
-                        f'{pokemon.get_name()} gained {experience} exp.')
+    def _apply_enemy(self, trainer: Trainer, enemy: Trainer, pokemon: Pokemon,
+                     enemy_pokemon: Pokemon,
+                     summary: ActionSummary) -> None:
+        """Hook for effects on the enemy's side; no-op on the base Move.
 
-        return summary
+        Parameters
+            trainer (Trainer): The trainer whose pokemon is using the move.
+            enemy (Trainer): The trainer whose pokemon is the target of the move.
+            pokemon (Pokemon): The trainer's current pokemon.
+            enemy_pokemon (Pokemon): The enemy's current pokemon.
+            summary (ActionSummary): The summary to add messages to.
+        """
 
     def __str__(self):
         """(str) Returns a string representation of a Move."""
-        return f"{self.__class__.__name__}('{self.get_name()}', '{self.get_element_type()}', {self.get_max_uses()})"
+        # read the fields directly rather than through three getters
+        return (f"{type(self).__name__}('{self._name}', "
+                f"'{self._element_type}', {self._max_uses})")
 
 
 class Attack(Move):
     """A class representing damaging pokemon moves, that may be used against
     an enemy pokemon. """
 
+    __slots__ = ('_base_damage', '_hit_chance', '_eff_cache')
+
+    HAS_ENEMY_EFFECT = True
+
     def __init__(
             self, name: str, element_type: str, max_uses: int, speed: int,
             base_damage: int, hit_chance: float
@@ -1112,6 +1391,7 @@ class Attack(Move):
         super().__init__(name, element_type, max_uses, speed)
         self._base_damage = base_damage
         self._hit_chance = hit_chance
+        self._eff_cache = {}  # defending type id -> effectiveness ratio
 
     def did_hit(self, pokemon: Pokemon) -> bool:
         """Determine if the move hit, based on the product of the pokemon's
@@ -1124,8 +1404,9 @@ class Attack(Move):
         Returns:
             (bool): True iff it hits.
         """
-        return did_succeed(
-            pokemon.get_stats().get_hit_chance() * self._hit_chance)
+        # inlined did_succeed: one fewer call frame on the hot path
+        return _random() < \
+            pokemon.get_stats().get_hit_chance() * self._hit_chance
 
     def calculate_damage(self, pokemon: Pokemon, enemy_pokemon: Pokemon) -> int:
         """Calculates what would be the total damage of using this move,
@@ -1139,20 +1420,73 @@ class Attack(Move):
         Returns:
             (int): The damage.
         """
-        attack_type = self.get_element_type()
-        defense_type = enemy_pokemon.get_element_type()
+        eff_num, eff_den = self._effectiveness_ratio(enemy_pokemon._type_id)
+
+        # both reads hit the pokemon's cached effective stats
+        stats = pokemon.get_stats()
+        enemy_stats = enemy_pokemon.get_stats()
+        return (self._base_damage * eff_num * stats.get_attack()) // (
+                (enemy_stats.get_defense() + 1) * eff_den)
+
+    def _effectiveness_ratio(self, defense_id: int) -> Tuple[int, int]:
+        """(tuple) Returns the effectiveness of this move against the given
+        defending type id as an integer numerator/denominator pair. """
+        ratio = self._eff_cache.get(defense_id)
+        if ratio is None:
+            # effectiveness multipliers are simple ratios (2x, 1/2x, ...);
+            # cache them as integer numerator/denominator pairs so the
+            # damage formula stays in integer arithmetic
+            effectiveness = Fraction(
+                eff_by_id(self._type_id, defense_id)
+            ).limit_denominator(1024)
+            ratio = (effectiveness.numerator, effectiveness.denominator)
+            self._eff_cache[defense_id] = ratio
+        return ratio
+
+    def _apply_enemy(self, trainer: Trainer, enemy: Trainer, pokemon: Pokemon,
+                     enemy_pokemon: Pokemon,
+                     summary: ActionSummary) -> None:
+        """Damage the enemy pokemon, awarding experience if it faints.
 
-        effectiveness = ElementType.of(attack_type).get_effectiveness(
-            defense_type)
-        attack_stat = pokemon.get_stats().get_attack()
-        defense_stat = enemy_pokemon.get_stats().get_defense()
-        return floor(self._base_damage * effectiveness * attack_stat / (
-                    defense_stat + 1))
+        Parameters
+            trainer (Trainer): The trainer whose pokemon is using the move.
+            enemy (Trainer): The trainer whose pokemon is the target of the move.
+            pokemon (Pokemon): The trainer's current pokemon.
+            enemy_pokemon (Pokemon): The enemy's current pokemon.
+            summary (ActionSummary): The summary to add messages to.
+        """
+        # pull the scalars out once and resolve the hit roll and damage in
+        # the module-level kernel
+        stats = pokemon.get_stats()
+        enemy_stats = enemy_pokemon.get_stats()
+        eff_num, eff_den = self._effectiveness_ratio(enemy_pokemon._type_id)
+        hit, damage = _resolve_attack(
+            self._base_damage, self._hit_chance, stats.get_hit_chance(),
+            stats.get_attack(), enemy_stats.get_defense(),
+            eff_num, eff_den, _random())
+
+        if not hit:
+            if not ActionSummary.SILENT:
+                summary.add_message(f'{enemy_pokemon.get_name()} missed!')
+        else:
+            enemy_pokemon.modify_health(-damage)
+            if enemy_pokemon.has_fainted():
+                # experience is still awarded in silent mode; only the
+                # message formatting is skipped
+                experience = enemy_pokemon.experience_on_death()
+                pokemon.gain_experience(experience)
+                if not ActionSummary.SILENT:
+                    summary.add_message(
+                        f'{enemy_pokemon.get_name()} has fainted.')
+                    summary.add_message(
+                        f'{pokemon.get_name()} gained {experience} exp.')
 
 
 class StatusModifier(Move):
     """An abstract class to group commonalities between buffs and debuffs."""
 
+    __slots__ = ('_modification', '_rounds')
+
     def __init__(
             self, name: str, element_type: str, max_uses: int, speed: int,
             modification: Stats, rounds: int
@@ -1186,14 +1520,51 @@ class StatusModifier(Move):
 class Buff(StatusModifier):
     """Moves which buff the trainer's selected pokemon.
     A buff is a stat modifier that is applied to the pokemon using the move."""
-    pass
+
+    __slots__ = ()
+
+    HAS_ALLY_EFFECT = True
+
+    def _apply_ally(self, trainer: Trainer, pokemon: Pokemon,
+                    summary: ActionSummary) -> None:
+        """Buff the move user's pokemon.
+
+        Parameters
+            trainer (Trainer): The trainer whose pokemon is using the move.
+            pokemon (Pokemon): The trainer's current pokemon.
+            summary (ActionSummary): The summary to add messages to.
+        """
+        summary.add_message(
+            f'{pokemon.get_name()} was buffed for {self.get_rounds()} turns.')
+        pokemon.add_stat_modifier(self.get_modification(), self.get_rounds())
 
 
 class Debuff(StatusModifier):
     """Moves which debuff the enemy trainer's selected pokemon. A debuff is a
     stat modifier that is applied to the enemy pokemon which is the target of
     this move. """
-    pass
+
+    __slots__ = ()
+
+    HAS_ENEMY_EFFECT = True
+
+    def _apply_enemy(self, trainer: Trainer, enemy: Trainer, pokemon: Pokemon,
+                     enemy_pokemon: Pokemon,
+                     summary: ActionSummary) -> None:
+        """Debuff the enemy's pokemon.
+
+        Parameters
+            trainer (Trainer): The trainer whose pokemon is using the move.
+            enemy (Trainer): The trainer whose pokemon is the target of the move.
+            pokemon (Pokemon): The trainer's current pokemon.
+            enemy_pokemon (Pokemon): The enemy's current pokemon.
+            summary (ActionSummary): The summary to add messages to.
+        """
+        summary.add_message(
+            f'{enemy_pokemon.get_name()} was debuffed for '
+            f'{self.get_rounds()} turns.')
+        enemy_pokemon.add_stat_modifier(self.get_modification(),
+                                        self.get_rounds())
 
 
 # Below are the classes and functions which pertain only to masters students.
@@ -1201,6 +1572,8 @@ class Strategy(object):
     """An abstract class providing behaviour to determine a next action given
     a battle state. """
 
+    __slots__ = ()
+
     @staticmethod
     def _switch_to_next_pokemon(battle: Battle, is_player: bool) -> Action:
         """Returns a SwitchPokemon action, assuming the current pokemon has fainted.
@@ -1214,10 +1587,10 @@ class Strategy(object):
         """
         trainer = battle.get_trainer(is_player)
 
-        all_pokemon = trainer.get_all_pokemon()
-        for index, next_pokemon in enumerate(all_pokemon):
-            if not next_pokemon.has_fainted():
-                return SwitchPokemon(index)
+        mask = trainer._alive_mask
+        if mask:
+            # the lowest set bit is the first non-fainted roster index
+            return SwitchPokemon((mask & -mask).bit_length() - 1)
 
     def get_next_action(self, battle: Battle, is_player: bool) -> Action:
         """Determines and returns the next action for this strategy,
@@ -1233,11 +1606,108 @@ class Strategy(object):
         raise NotImplementedError()
 
 
+# Flee carries no state, so the strategy functions can hand out one
+# shared instance instead of allocating a new action every turn.
+_FLEE = Flee()
+
+
+def scaredy_cat_next(battle: Battle, is_player: bool) -> Action:
+    """Next action for the ScaredyCat strategy: always attempt to flee,
+    switching to the next available pokemon if the current one faints.
+
+    Parameters:
+        battle (Battle): The ongoing pokemon battle
+        is_player (bool): True iff the player is using this action.
+
+    Returns:
+        (Action): The action to perform.
+    """
+    trainer = battle.get_trainer(is_player)
+    pokemon = trainer.get_current_pokemon()
+
+    # If the current pokemon is dead, choose first non-dead.
+    if pokemon.has_fainted():
+        return Strategy._switch_to_next_pokemon(battle, is_player)
+
+    return _FLEE
+
+
+def team_rocket_next(battle: Battle, is_player: bool) -> Action:
+    """Next action for the TeamRocket strategy.
+
+    Parameters:
+        battle (Battle): The ongoing pokemon battle
+        is_player (bool): True iff the player is using this action.
+
+    Returns:
+        (Action): The action to perform.
+    """
+    trainer = battle.get_trainer(is_player)
+    enemy = battle.get_trainer(not is_player)
+    pokemon = trainer.get_current_pokemon()
+    enemy_pokemon = enemy.get_current_pokemon()
+    defense_type = enemy_pokemon.get_element_type()
+
+    # Switch to the next available pokemon if the current one faints, and
+    # attempt to flee any wild battle; both handled directly rather than
+    # falling through to the ScaredyCat strategy, which would re-check the
+    # faint condition
+    if pokemon.has_fainted():
+        return Strategy._switch_to_next_pokemon(battle, is_player)
+    if not battle.is_trainer_battle():
+        return _FLEE
+
+    # Catch pikachu
+    if enemy_pokemon.get_name().lower() == 'pikachu':
+        # throw a pokeball if one exists in the inventory
+        pokeball = trainer.get_first_pokeball()
+        if pokeball is not None:
+            return pokeball
+
+    if not pokemon.has_moves_left():
+        return _FLEE
+
+    # Choose first move with a type effectiveness greater than 1x against
+    # the enemy pokemon's type; iterate the parallel move arrays directly
+    # rather than building (move, uses) tuples
+    moves = pokemon._moves
+    uses = pokemon._move_uses
+    candidate_move = None
+    for index in range(len(moves)):
+        if uses[index] > 0:
+            move = moves[index]
+            if candidate_move is None:
+                candidate_move = move
+            attack_type = move.get_element_type()
+            if ElementType.of(attack_type).get_effectiveness(
+                    defense_type) > 1:
+                return move
+
+    # Otherwise, use the first available move with uses
+    return candidate_move
+
+
+# Strategy ids and dispatch table; simulation loops can look the function
+# up once by id and call it directly instead of dispatching through a
+# strategy object every turn.
+STRAT_SCAREDY_CAT = 0
+STRAT_TEAM_ROCKET = 1
+
+STRATEGY_FNS = {
+    STRAT_SCAREDY_CAT: scaredy_cat_next,
+    STRAT_TEAM_ROCKET: team_rocket_next,
+}
+
+
 class ScaredyCat(Strategy):
     """A strategy where the trainer always attempts to flee. Switches to the
     next available pokemon if the current one faints, and then keeps
     attempting to flee. """
 
+    __slots__ = ()
+
+    strategy_id = STRAT_SCAREDY_CAT
+
     def get_next_action(self, battle: Battle, is_player: bool) -> Action:
         """Determines and returns the next action for this strategy,
         given the battle state and trainer.
@@ -1249,20 +1719,17 @@ class ScaredyCat(Strategy):
         Returns:
             (Action): The action to perform.
         """
-        trainer = battle.get_trainer(is_player)
-        pokemon = trainer.get_current_pokemon()
-
-        # If the current pokemon is dead, choose first non-dead.
-        if pokemon.has_fainted():
-            return Strategy._switch_to_next_pokemon(battle, is_player)
-
-        return Flee()
+        return scaredy_cat_next(battle, is_player)
 
 
 class TeamRocket(Strategy):
     """A tough strategy used by Pokemon Trainers that are members of Team
     Rocket. """
 
+    __slots__ = ()
+
+    strategy_id = STRAT_TEAM_ROCKET
+
     def get_next_action(self, battle: Battle, is_player: bool) -> Action:
         """Determines and returns the next action for this strategy,
         given the battle state and trainer.
@@ -1274,40 +1741,13 @@ class TeamRocket(Strategy):
         Returns:
             (Action): The action to perform.
         """
-        trainer = battle.get_trainer(is_player)
-        enemy = battle.get_trainer(not is_player)
-        pokemon = trainer.get_current_pokemon()
-        enemy_pokemon = enemy.get_current_pokemon()
-        defense_type = enemy_pokemon.get_element_type()
-
-        # Switch to the next available pokemon if the current one faints or
-        # Attempt to flee any wild battle
-        if pokemon.has_fainted() or not battle.is_trainer_battle():
-            return ScaredyCat().get_next_action(battle, is_player)
-
-        # Catch pikachu
-        if enemy_pokemon.get_name().lower() == 'pikachu':
-            # throw pokeball if some exist in the inventory
-            for item in trainer.get_inventory().keys():
-                if type(item) is Pokeball:
-                    return item
-
-        if not pokemon.has_moves_left():
-            return Flee()
-
-        # Choose first move with a type effectiveness greater than 1x against
-        # the enemy pokemon's type
-        candidate_move = []
-        for move, uses in pokemon.get_move_info():
-            if uses > 0:
-                candidate_move.append(move)
-                attack_type = move.get_element_type()
-                if ElementType.of(attack_type).get_effectiveness(
-                        defense_type) > 1:
-                    return move
-
-        # Otherwise, use the first available move with uses
-        return candidate_move[0]
+        return team_rocket_next(battle, is_player)
+
+
+# Strategies are stateless, so a single shared instance of each can be
+# handed to any number of battles instead of constructing one per battle.
+SCAREDY_CAT = ScaredyCat()
+TEAM_ROCKET = TeamRocket()
 
 
 def create_encounter(trainer: Trainer, wild_pokemon: Pokemon) -> Battle:
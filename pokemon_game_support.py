@@ -40,14 +40,20 @@ class ElementType(object):
 
     _elements = {}
 
+    # Each type name is assigned a small integer id the first time it is
+    # seen, and effectiveness values are mirrored into a 2D table indexed
+    # by those ids so lookups are a list index rather than a dict probe.
+    _type_ids = {}
+    _eff_table = []
+
     @staticmethod
     def of(name: str) -> 'ElementType':
         """A static method which returns the instance corresponding to the
         supplied name, creating it if it doesn't yet exist.
-        
+
         Parameters:
             name (str): The unique name of the elemental type.
-        
+
         Returns:
             (ElementType): The element type corresponding to the given name.
         """
@@ -55,6 +61,27 @@ class ElementType(object):
             return ElementType._elements[name]
         return ElementType(name)
 
+    @staticmethod
+    def id_of(name: str) -> int:
+        """A static method which returns the integer id for the supplied
+        type name, assigning one (and growing the effectiveness table) if
+        the name hasn't been seen before.
+
+        Parameters:
+            name (str): The unique name of the elemental type.
+
+        Returns:
+            (int): The integer id of the type.
+        """
+        type_id = ElementType._type_ids.get(name)
+        if type_id is None:
+            type_id = len(ElementType._type_ids)
+            ElementType._type_ids[name] = type_id
+            for row in ElementType._eff_table:
+                row.append(1.0)
+            ElementType._eff_table.append([1.0] * (type_id + 1))
+        return type_id
+
     def __init__(self, name: str) -> None:
         """ Creates an ElementType instance and adds it to the class-wide
         dictionary.
@@ -63,9 +90,14 @@ class ElementType(object):
             name (str): The unique name of the elemental type.
         """
         self._name = name
+        self._id = ElementType.id_of(name)
         self._effectiveness = {}
         ElementType._elements[name] = self
 
+    def get_id(self) -> int:
+        """(int) Return the integer id of this type."""
+        return self._id
+
     def add_type_effectiveness(self, type: str, effectiveness: float) -> None:
         """Associates a type and effectiveness for this instance.
 
@@ -73,21 +105,26 @@ class ElementType(object):
             type (str): The unique name of the added type
             effectiveness (float): The damage multiplier when a move of this
                     instance's type attacks a pokemon of the supplied type.
-        
+
         """
         self._effectiveness[type] = effectiveness
+        ElementType._eff_table[self._id][ElementType.id_of(type)] = \
+            effectiveness
 
     def get_effectiveness(self, defending_type: str) -> float:
         """Get the effectiveness of this instance's type against the supplied
         defending type.
-        
+
         Parameters:
             defending_type (str): The unique name of the defending type
-            
+
         Returns:
             (float): The damage multiplier of a move against the defending type
         """
-        return self._effectiveness.get(defending_type, 1.0)
+        defending_id = ElementType._type_ids.get(defending_type)
+        if defending_id is None:
+            return 1.0
+        return ElementType._eff_table[self._id][defending_id]
 
     def __str__(self) -> str:
         """(str): Return a string representation of this class"""
@@ -98,6 +135,20 @@ class ElementType(object):
         return str(self)
 
 
+def eff_by_id(attack_id: int, defense_id: int) -> float:
+    """Get the effectiveness of one type against another by integer id, as
+    assigned by ElementType.id_of.
+
+    Parameters:
+        attack_id (int): The id of the attacking type.
+        defense_id (int): The id of the defending type.
+
+    Returns:
+        (float): The damage multiplier of a move against the defending type
+    """
+    return ElementType._eff_table[attack_id][defense_id]
+
+
 def did_succeed(chance: float) -> bool:
     """Performs a 'roll' based on the supplied chance, and returns true iff
     the roll succeeded.